@@ -566,6 +566,9 @@ class OllamaCodeAgent:
             # Don't let the AI continue working on tasks in this call
             console.print(f"\n🚀 [cyan]Tasks created! Starting execution...[/cyan]")
             
+            # A new plan must not inherit progress saved for tasks with the same name
+            self.task_validator.clear_progress()
+            
             # Execute tasks in separate calls
             await self._execute_tasks_sequentially(enable_esc_cancel)
             return "Task execution completed. Control returned to user."
@@ -1002,6 +1005,13 @@ class OllamaCodeAgent:
         # Track project directory if created
         project_dir = None
         
+        # Drop saved validation progress left over from earlier, unfinished runs
+        self.task_validator.retain_progress(
+            todo.content
+            for status in (TodoStatus.IN_PROGRESS, TodoStatus.PENDING)
+            for todo in self.todo_manager.get_todos_by_status(status)
+        )
+        
         while self.thought_loop.should_continue_tasks() and not cancelled_all:
             # Get the next task context
             next_task_context = self.thought_loop.get_next_task_context()
@@ -1026,6 +1036,7 @@ class OllamaCodeAgent:
                 target_dir = os.path.join(initial_cwd, project_dir)
                 if os.path.exists(target_dir) and os.getcwd() != target_dir:
                     os.chdir(target_dir)
+                    self.thought_loop.refresh_cwd()
                     logger.info(f"Changed working directory to: {target_dir}")
             
             # Clear conversation history to prevent AI from seeing previous tasks
@@ -1198,10 +1209,8 @@ class OllamaCodeAgent:
         if cancelled_all:
             console.print("\n" + "=" * 50)
             console.print("\n⛔ [red]Task execution stopped by user[/red]")
-            completed_tasks = self.todo_manager.get_todos_by_status(TodoStatus.COMPLETED)
-            pending_tasks = self.todo_manager.get_todos_by_status(TodoStatus.PENDING)
-            in_progress_tasks = self.todo_manager.get_todos_by_status(TodoStatus.IN_PROGRESS)
-            console.print(f"\n📊 Status: {len(completed_tasks)} completed, {len(in_progress_tasks)} in progress, {len(pending_tasks)} pending")
+            pending_count, in_progress_count, completed_count, _ = self.todo_manager.get_status_counts()
+            console.print(f"\n📊 Status: {completed_count} completed, {in_progress_count} in progress, {pending_count} pending")
             console.print("\n💡 [yellow]Use /tasks to see remaining tasks or start a new request[/yellow]")
             console.print("=" * 50 + "\n")
         else:
@@ -1222,7 +1231,7 @@ class OllamaCodeAgent:
                 console.print("\n🧹 [dim]Todo list cleared[/dim]")
                 
                 # Clear task validator's partial progress tracking
-                self.task_validator.partial_progress.clear()
+                self.task_validator.clear_progress()
                 
                 console.print("\n💬 [cyan]Ready for your next command![/cyan]")
                 console.print("=" * 50 + "\n")
@@ -2,6 +2,8 @@
 
 import os
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
@@ -14,10 +16,266 @@ from .task_decomposer import TaskDecomposer, ConcreteSubTask
 
 console = Console()
 
+# Display styling per task priority
+_PRIORITY_EMOJI = {
+    TodoPriority.HIGH: "🔴",
+    TodoPriority.MEDIUM: "🟡",
+    TodoPriority.LOW: "🟢"
+}
+
+_PRIORITY_COLORS = {
+    TodoPriority.HIGH: "red",
+    TodoPriority.MEDIUM: "yellow",
+    TodoPriority.LOW: "green"
+}
+
+
+# Reminder to keep files inside the project directory
+_PROJECT_CONTEXT_REMINDER = (
+    "🚨 PROJECT CONTEXT REMINDER:\n"
+    "If working in a project directory, ensure all files are created with the correct paths.\n"
+    "NEVER create files in the root directory when working on a project!\n\n"
+)
+
+# Rules that apply to every task
+_CRITICAL_RULES_BLOCK = (
+    "🚨 CRITICAL: STOP EXPLAINING, START DOING!\n\n"
+    "You MUST execute Python code to create/modify files!\n"
+    "DO NOT just describe what should be done!\n"
+    "DO NOT show file contents without write_file() or edit_file()!\n\n"
+)
+
+# Retry of a task whose analysis is already in previous results
+_SKIP_ANALYSIS_BLOCK = (
+    "SKIP ANALYSIS - GO DIRECTLY TO IMPLEMENTATION:\n"
+    "```python\n"
+    "# Analysis already done. CREATE FILES NOW!\n"
+    "# Use write_file() for new files\n"
+    "# Use edit_file() for small changes to existing files\n"
+    "```\n\n"
+)
+
+# Default check-then-create pattern
+_EXECUTE_PATTERN_BLOCK = (
+    "EXECUTE THIS PATTERN:\n"
+    "```python\n"
+    "# 1. Check what exists\n"
+    "files = list_files()\n"
+    "print(files)\n"
+    "```\n\n"
+    "```python\n"
+    "# 2. Create/modify files based on the task\n"
+    "# Use write_file() for new files\n"
+    "# Use edit_file() for small changes to existing files\n"
+    "# Use read_file() + write_file() for major changes\n"
+    "```\n\n"
+)
+
+# Project creation tasks must create files, not just a directory
+_PROJECT_CREATION_BLOCK = (
+    "🚨 PROJECT CREATION TASK - YOU MUST CREATE FILES:\n"
+    "When creating a project directory, you MUST also create initial files:\n"
+    "- Create the project directory structure\n"
+    "- Initialize the project with appropriate config files\n"
+    "- Create initial source files\n"
+    "- Add a README.md file\n\n"
+    "IMPORTANT: Creating just the directory is NOT enough. You MUST create files!\n\n"
+)
+
+# Analysis task whose findings are already in previous results
+_ANALYSIS_COMPLETE_BLOCK = (
+    "\n[ANALYSIS ALREADY COMPLETE - SKIP TO IMPLEMENTATION]\n\n"
+    "Previous analysis found the necessary information.\n"
+    "Now IMPLEMENT based on what was discovered.\n\n"
+)
+
+# Commands to run for information gathering tasks
+_ANALYSIS_TASK_TEMPLATE = (
+    "\n[ANALYSIS TASK - EXECUTE THESE COMMANDS]\n\n"
+    "Execute each code block below one at a time:\n\n"
+    "```python\n"
+    "# Read project context\n"
+    "content = read_file('OLLAMA.md')\n"
+    "print(content[:1000])\n"
+    "```\n\n"
+    "```python\n"
+    "# List project files\n"
+    "files = list_files()\n"
+    "print(files)\n"
+    "```\n\n"
+    "```python\n"
+    "# Find Python files\n"
+    "result = bash('find . -name \\\"*.py\\\" | head -20')\n"
+    "print(result)\n"
+    "```\n\n"
+    "After executing, summarize what you found.\n"
+)
+
+# Step-by-step file creation example and bash guidance
+_FILE_CREATION_EXAMPLES = (
+    "\n[FILE CREATION/MODIFICATION TASK - EXECUTE NOW]\n\n"
+    "🚨 YOU MUST EXECUTE CODE TO CREATE/MODIFY FILES!\n\n"
+    "Step 1: Check what files exist:\n"
+    "```python\n"
+    "import os\n"
+    "files = list_files()\n"
+    "print(\"Current files:\", files)\n"
+    "```\n\n"
+    "Step 2: Read existing files if modifying:\n"
+    "```python\n"
+    "# Read any files you need to modify\n"
+    "# based on what you found in step 1\n"
+    "```\n\n"
+    "Step 3: CREATE THE FILES NOW:\n"
+    "```python\n"
+    "# STOP! DO NOT SKIP THIS STEP!\n"
+    "# You MUST execute write_file() commands here!\n"
+    "\n"
+    "# Example (replace with actual implementation):\n"
+    "write_file(\"server.js\", \"\"\"// Your server code here\"\"\")\n"
+    "write_file(\"index.html\", \"\"\"<!-- Your HTML here -->\"\"\")\n"
+    "\n"
+    "# THE TASK WILL FAIL IF YOU DON'T CREATE FILES!\n"
+    "```\n\n"
+    "🚨 CRITICAL: EXECUTE write_file() COMMANDS NOW!\n\n"
+    # Add bash command guidance
+    "BASH COMMAND GUIDELINES:\n"
+    "- Always use proper directory navigation: bash('cd project && command')\n"
+    "- Check if directories exist before navigating: bash('ls')\n"
+    "- Use && to chain commands that depend on each other\n"
+    "- Use ; to run independent commands\n"
+    "- Always quote paths with spaces\n\n"
+)
+
+# GUI tasks should lay out directories first
+_GUI_DIRECTORIES_BLOCK = (
+    "📁 FOR GUI FILES - CREATE DIRECTORIES FIRST:\n"
+    "- Create appropriate directory structure (e.g., public/, src/, assets/)\n"
+    "- Place HTML/CSS/JS files in the correct directories\n\n"
+)
+
+# Ollama API summary for Ollama-related tasks
+_OLLAMA_API_REFERENCE = (
+    "OLLAMA API REFERENCE:\n"
+    "- Base URL: http://localhost:11434\n"
+    "- Chat endpoint: POST /api/chat with {model, messages, stream}\n"
+    "- Generate endpoint: POST /api/generate with {model, prompt, stream}\n"
+    "- Models endpoint: GET /api/tags\n"
+    "- Use 'llama2' as default model name\n\n"
+)
+
+# Guidance for OLLAMA.md update tasks
+_OLLAMA_MD_GUIDANCE = (
+    "\n[Guidance for updating OLLAMA.md:]"
+    "\n- Use read_file('OLLAMA.md') to check current content"
+    "\n- If it doesn't exist, create it with write_file()"
+    "\n- Add or update sections based on work completed:"
+    "\n  - New features implemented"
+    "\n  - API endpoints created"
+    "\n  - Configuration changes"
+    "\n  - Usage instructions"
+    "\n- Keep the documentation concise and helpful\n"
+)
+
+# Keywords (matched as substrings) that mark a file creation task
+_FILE_CREATION_KEYWORDS = ('create', 'write', 'develop', 'implement', 'script', 'test', 'endpoint',
+                           'backend', 'service', 'websocket', 'socket')
+
+# Signs in previous results that analysis already ran ('current files:' is
+# implied by 'files:', so it is not listed separately)
+_RETRY_ANALYSIS_MARKERS = ('files:', 'found', 'list_files()')
+_ANALYSIS_DONE_MARKERS = ('files:', 'found:', 'project structure:', 'analysis complete')
+
+
+def _contains_in_order(text: str, words: Tuple[str, ...]) -> bool:
+    """Check if the words occur in order on a single line of text (like 'a.*b.*c')"""
+    # Taking the earliest match for each word is optimal, so each line is tried
+    # once from its first occurrence of the leading word; no regex backtracking
+    first = words[0]
+    start = 0
+    while True:
+        pos = text.find(first, start)
+        if pos < 0:
+            return False
+        line_end = text.find('\n', pos)
+        if line_end < 0:
+            line_end = len(text)
+        pos += len(first)
+        for word in words[1:]:
+            pos = text.find(word, pos, line_end)
+            if pos < 0:
+                break
+            pos += len(word)
+        else:
+            return True
+        start = line_end + 1
+
+
+# Only truly complex multi-step operations: words that appear in this order
+# on one line of the lowercased request
+_COMPLEX_SEQUENCES = (
+    ('build', 'full', 'application'),
+    ('create', 'complete', 'system'),
+    ('develop', 'from', 'scratch'),
+    ('implement', 'entire', 'project'),
+    ('setup', 'ci', 'cd', 'pipeline'),
+    ('multiple', 'steps', 'required'),
+    ('step', 'by', 'step', 'guide'),
+    ('full', 'stack', 'application')
+)
+
+# Simple indicators that suggest it's NOT complex (matched at the start)
+_SIMPLE_RE = re.compile('|'.join([
+    r'what\s+is',
+    r'explain',
+    r'show\s+me',
+    r'tell\s+me',
+    r'list',
+    r'hello',
+    r'hi',
+    r'\s*$',
+    r'create\s+a\s+\w+\s+(directory|folder|file)',
+    r'make\s+a\s+\w+\s+(directory|folder|file)',
+    r'install',
+    r'run',
+    r'execute',
+    r'test'
+]))
+
+# Numbered steps or bullet points starting a line
+_STEP_MARKER_RE = re.compile(r'(?:\n\d+\.|\n[-*])')
+
+
+@lru_cache(maxsize=512)
+def _classify(request_lower: str) -> bool:
+    """Classify a lowercased request as complex; repeated prompts are cached"""
+    # Check if it's explicitly simple
+    if _SIMPLE_RE.match(request_lower):
+        return False
+    
+    # Check if it contains complex patterns
+    if any(_contains_in_order(request_lower, words) for words in _COMPLEX_SEQUENCES):
+        return True
+    
+    # Check word count - only very long requests; 51 words need at least
+    # 101 characters, so shorter requests skip the split
+    if len(request_lower) > 100 and len(request_lower.split()) > 50:  # Increased threshold significantly
+        return True
+    
+    # Check for multiple numbered steps or many bullet points
+    if len(_STEP_MARKER_RE.findall(request_lower)) > 3:
+        return True
+    
+    return False
+
 
 class ThoughtLoop:
     """Manages the AI's thought process and task decomposition"""
     
+    _MAX_CACHED_PLANS = 64
+    _MAX_CACHED_DOC_CONTEXTS = 64
+    _MAX_PREVIOUS_RESULTS = 5  # Completed tasks whose results are repeated in the next prompt
+    
     def __init__(self, todo_manager: TodoManager = None, model_name: str = None, doc_assistant=None):
         self.todo_manager = todo_manager or TodoManager()
         self.current_task_context = []
@@ -27,11 +285,18 @@ class ThoughtLoop:
         self.task_results = {}  # Store results from completed tasks
         self.current_subtask_manager = None  # Current sub-task manager
         self.doc_assistant = doc_assistant  # Documentation assistant
+        self._doc_context_cache = OrderedDict()  # Formatted documentation context per task content, LRU
+        self._plan_cache = OrderedDict()  # (tasks, explanation) per whitespace-normalized request, LRU
         self.task_attempts = {}  # Track retry attempts per task
         self.task_decomposer = TaskDecomposer()  # New task decomposer
         self.current_subtasks = []  # Current concrete subtasks
         self.current_subtask_index = 0
         self.current_todo_id = None  # Track which todo the subtasks belong to  # Index of current subtask
+        self._cwd = os.getcwd()  # Working directory shown in task prompts; see refresh_cwd()
+    
+    def refresh_cwd(self):
+        """Re-read the working directory after an os.chdir"""
+        self._cwd = os.getcwd()
     
     def process_request(self, request: str) -> Tuple[List[Dict], str]:
         """
@@ -41,12 +306,24 @@ class ThoughtLoop:
         # Analyze if this is a complex request that needs task breakdown
         if self._is_complex_request(request):
             if self.task_planner:
-                # Get tasks and explanation from AI
-                console.print("[dim]🤔 Analyzing request and planning tasks...[/dim]")
-                tasks, explanation = self.task_planner.plan_tasks(request)
+                plan_key = " ".join(request.split())
+                cached_plan = self._plan_cache.get(plan_key)
+                if cached_plan:
+                    self._plan_cache.move_to_end(plan_key)
+                    tasks, explanation = cached_plan
+                    tasks = [dict(task) for task in tasks]
+                else:
+                    # Get tasks and explanation from AI
+                    console.print("[dim]🤔 Analyzing request and planning tasks...[/dim]")
+                    tasks, explanation = self.task_planner.plan_tasks(request)
+                    # Only keep usable plans so a failed planning call is retried next time
+                    if tasks and all("name" in task and "priority" in task for task in tasks):
+                        self._plan_cache[plan_key] = ([dict(task) for task in tasks], explanation)
+                        if len(self._plan_cache) > self._MAX_CACHED_PLANS:
+                            self._plan_cache.popitem(last=False)
                 if tasks and len(tasks) > 0:
                     self._add_tasks_to_todos(tasks)
-                    initial_response = self._generate_task_response_with_explanation(tasks, explanation)
+                    initial_response = self._generate_task_response(tasks, explanation)
                     return tasks, initial_response
             
             # Fallback if AI planning fails
@@ -60,56 +337,10 @@ class ThoughtLoop:
     
     def _is_complex_request(self, request: str) -> bool:
         """Determine if a request needs task breakdown"""
-        # Only truly complex multi-step operations
-        complex_indicators = [
-            r'build.*full.*application',
-            r'create.*complete.*system',
-            r'develop.*from.*scratch',
-            r'implement.*entire.*project',
-            r'setup.*ci.*cd.*pipeline',
-            r'multiple.*steps.*required',
-            r'step.*by.*step.*guide',
-            r'full.*stack.*application'
-        ]
-        
-        # Simple indicators that suggest it's NOT complex
-        simple_indicators = [
-            r'^what\s+is',
-            r'^explain',
-            r'^show\s+me',
-            r'^tell\s+me',
-            r'^list',
-            r'^hello',
-            r'^hi',
-            r'^\s*$',
-            r'^create\s+a\s+\w+\s+(directory|folder|file)',
-            r'^make\s+a\s+\w+\s+(directory|folder|file)',
-            r'^install',
-            r'^run',
-            r'^execute',
-            r'^test'
-        ]
-        
-        request_lower = request.lower()
-        
-        # Check if it's explicitly simple
-        if any(re.match(pattern, request_lower) for pattern in simple_indicators):
+        # Too short for any complex pattern, step list or word-count threshold
+        if len(request.strip()) < 4:
             return False
-        
-        # Check if it contains complex patterns
-        if any(re.search(pattern, request_lower) for pattern in complex_indicators):
-            return True
-        
-        # Check word count - only very long requests
-        words = request.split()
-        if len(words) > 50:  # Increased threshold significantly
-            return True
-        
-        # Check for multiple numbered steps or many bullet points
-        if len(re.findall(r'(?:\n\d+\.|\n[-*])', request)) > 3:
-            return True
-        
-        return False
+        return _classify(request.lower())
     
     def _decompose_request(self, request: str) -> List[Dict]:
         """Break down a complex request into tasks using AI"""
@@ -132,44 +363,66 @@ class ThoughtLoop:
     
     def _add_tasks_to_todos(self, tasks: List[Dict]):
         """Add tasks to the todo manager"""
-        for task in tasks:
-            self.todo_manager.add_todo(
-                content=task["name"],
-                priority=task["priority"]
-            )
+        self.todo_manager.add_todos_bulk([(task["name"], task["priority"]) for task in tasks])
     
-    def _generate_task_response(self, tasks: List[Dict]) -> str:
-        """Generate a response explaining the task breakdown"""
-        response = "I'll help you with this step by step. Here's my approach:\n\n"
-        
-        for i, task in enumerate(tasks, 1):
-            priority_emoji = {
-                TodoPriority.HIGH: "🔴",
-                TodoPriority.MEDIUM: "🟡",
-                TodoPriority.LOW: "🟢"
-            }
-            emoji = priority_emoji.get(task["priority"], "⚪")
-            response += f"{i}. {emoji} {task['name']}\n"
-        
-        response += "\nI'll work through these tasks one at a time."
-        return response
+    def _get_documentation(self, content: str) -> str:
+        """Documentation context for a task; retries of the same task reuse it"""
+        doc_context = self._doc_context_cache.get(content)
+        if doc_context is not None:
+            self._doc_context_cache.move_to_end(content)
+            return doc_context
+        if self.doc_assistant is None:
+            return ""
+        try:
+            # Search for relevant documentation
+            doc_context = self._format_doc_context(self.doc_assistant.get_documentation_context(content))
+        except Exception as e:
+            console.print(f"[dim]Could not fetch documentation: {e}[/dim]")
+            return ""
+        self._doc_context_cache[content] = doc_context
+        if len(self._doc_context_cache) > self._MAX_CACHED_DOC_CONTEXTS:
+            self._doc_context_cache.popitem(last=False)
+        return doc_context
     
-    def _generate_task_response_with_explanation(self, tasks: List[Dict], explanation: str) -> str:
-        """Generate a response with AI-provided explanation"""
-        response = f"{explanation}\n\n"
-        response += "Here's my task breakdown:\n\n"
-        
-        for i, task in enumerate(tasks, 1):
-            priority_emoji = {
-                TodoPriority.HIGH: "🔴",
-                TodoPriority.MEDIUM: "🟡",
-                TodoPriority.LOW: "🟢"
-            }
-            emoji = priority_emoji.get(task["priority"], "⚪")
-            response += f"{i}. {emoji} {task['name']}\n"
+    @staticmethod
+    def _format_doc_context(doc_context: str) -> str:
+        """Wrap documentation context for inclusion in a task prompt"""
+        return "\n## Relevant Documentation\n" + doc_context + "\n" if doc_context else ""
+    
+    @staticmethod
+    def _format_task_list(tasks: List[Dict]) -> str:
+        """Format tasks as a numbered list with priority emojis"""
+        return "".join(f"{i}. {_PRIORITY_EMOJI.get(task['priority'], '⚪')} {task['name']}\n"
+                       for i, task in enumerate(tasks, 1))
+    
+    def _generate_task_response(self, tasks: List[Dict], explanation: Optional[str] = None) -> str:
+        """Generate a response explaining the task breakdown, led by the AI's explanation if given"""
+        if explanation is None:
+            return ("I'll help you with this step by step. Here's my approach:\n\n"
+                    + self._format_task_list(tasks)
+                    + "\nI'll work through these tasks one at a time.")
+        return (f"{explanation}\n\n"
+                "Here's my task breakdown:\n\n"
+                + self._format_task_list(tasks)
+                + "\nI'll work through these tasks systematically.")
+    
+    def _build_previous_results(self) -> str:
+        """Build the results block for the most recently completed tasks"""
+        completed = self.todo_manager.get_todos_by_status(TodoStatus.COMPLETED)
+        if not completed:
+            return ""
         
-        response += "\nI'll work through these tasks systematically."
-        return response
+        # Only the latest results are included so the prompt stays bounded in long sessions
+        first = max(len(completed) - self._MAX_PREVIOUS_RESULTS, 0)
+        parts = ["\n## Results from Previous Tasks:\n"]
+        for i, task in enumerate(completed[first:], first + 1):
+            parts.append(f"\n### Task {i}: {task.content[:80]}...\n")
+            if task.id in self.task_results:
+                parts.append(f"{self.task_results[task.id]}\n")
+            else:
+                parts.append("No specific results recorded.\n")
+        parts.append("\nUSE THESE RESULTS! Build on what was discovered and created in previous tasks!\n")
+        return "".join(parts)
     
     def get_next_task_context(self) -> Optional[str]:
         """Get context for the next task to work on"""
@@ -188,16 +441,16 @@ class ThoughtLoop:
                         break
             
             if can_execute:
-                context = f"\n🎯 [SUBTASK {self.current_subtask_index + 1}/{len(self.current_subtasks)}]\n"
-                context += f"Task: {current_subtask.description}\n"
-                context += f"Validation: {current_subtask.validation}\n\n"
-                context += "EXECUTE ONLY THIS CODE:\n"
-                context += "```python\n"
-                context += current_subtask.action
-                context += "\n```\n\n"
-                context += "IMPORTANT: Execute ONLY the code above. Do not add anything else.\n"
-                context += "The output will be validated against: " + current_subtask.validation + "\n"
-                return context
+                return "".join([
+                    f"\n🎯 [SUBTASK {self.current_subtask_index + 1}/{len(self.current_subtasks)}]\n",
+                    f"Task: {current_subtask.description}\n",
+                    f"Validation: {current_subtask.validation}\n\n",
+                    "EXECUTE ONLY THIS CODE:\n```python\n",
+                    current_subtask.action,
+                    "\n```\n\n"
+                    "IMPORTANT: Execute ONLY the code above. Do not add anything else.\n"
+                    "The output will be validated against: ", current_subtask.validation, "\n"
+                ])
         
         # Otherwise, get the next todo
         next_todo = self.todo_manager.get_next_todo()
@@ -211,12 +464,7 @@ class ThoughtLoop:
             self.todo_manager.update_todo(next_todo.id, status=TodoStatus.IN_PROGRESS.value)
             
             # Display starting task message
-            priority_colors = {
-                TodoPriority.HIGH: "red",
-                TodoPriority.MEDIUM: "yellow", 
-                TodoPriority.LOW: "green"
-            }
-            color = priority_colors.get(next_todo.priority, "white")
+            color = _PRIORITY_COLORS.get(next_todo.priority, "white")
             console.print(f"\n🚀 [cyan]Starting task:[/cyan] [{color}]{next_todo.content}[/{color}]")
             
             # Create concrete subtasks only if we don't already have them for this todo
@@ -237,202 +485,91 @@ class ThoughtLoop:
             if subtasks:
                 self.current_subtask_manager = subtask_manager
             
-            # Build context from previous completed tasks
-            completed = self.todo_manager.get_todos_by_status(TodoStatus.COMPLETED)
-            pending = self.todo_manager.get_todos_by_status(TodoStatus.PENDING)
-            
             # Include results from previous tasks
-            previous_results = ""
-            if completed:
-                previous_results = "\n## Results from Previous Tasks:\n"
-                for i, task in enumerate(completed, 1):
-                    previous_results += f"\n### Task {i}: {task.content[:80]}...\n"
-                    if task.id in self.task_results:
-                        previous_results += f"{self.task_results[task.id]}\n"
-                    else:
-                        previous_results += "No specific results recorded.\n"
-                previous_results += "\nUSE THESE RESULTS! Build on what was discovered and created in previous tasks!\n"
+            previous_results = self._build_previous_results()
             
             # Get documentation context for this task
-            doc_context = ""
-            if hasattr(self, 'doc_assistant'):
-                try:
-                    # Search for relevant documentation
-                    doc_context = self.doc_assistant.get_documentation_context(next_todo.content)
-                    if doc_context:
-                        doc_context = "\n## Relevant Documentation\n" + doc_context + "\n"
-                except Exception as e:
-                    console.print(f"[dim]Could not fetch documentation: {e}[/dim]")
+            doc_context = self._get_documentation(next_todo.content)
+            
+            # Keyword checks below all run against the same lowered strings
+            content_lower = next_todo.content.lower()
+            previous_lower = previous_results.lower()
             
             # Create focused context for this specific task
-            context = f"Please complete the following task:\n\n{next_todo.content}\n\n"
+            parts = [f"Please complete the following task:\n\n{next_todo.content}\n\n"]
             
             # Add critical project context reminder  
-            if "project" in next_todo.content.lower() and "directory" in str(previous_results).lower():
-                context += "🚨 PROJECT CONTEXT REMINDER:\n"
-                context += "If working in a project directory, ensure all files are created with the correct paths.\n"
-                context += "NEVER create files in the root directory when working on a project!\n\n"
+            if "project" in content_lower and "directory" in previous_lower:
+                parts.append(_PROJECT_CONTEXT_REMINDER)
             if doc_context:
-                context += doc_context
+                parts.append(doc_context)
             if previous_results:
-                context += previous_results + "\n"
+                parts.append(previous_results + "\n")
             
-            context += "🚨 CRITICAL: STOP EXPLAINING, START DOING!\n\n"
-            context += "You MUST execute Python code to create/modify files!\n"
-            context += "DO NOT just describe what should be done!\n"
-            context += "DO NOT show file contents without write_file() or edit_file()!\n\n"
+            parts.append(_CRITICAL_RULES_BLOCK)
             
             # Detect if this is a retry and analysis was already done
             is_retry = self.task_attempts.get(next_todo.id, 0) > 1
-            has_previous_analysis = previous_results and any(indicator in previous_results.lower() 
-                for indicator in ['files:', 'current files:', 'found', 'list_files()'])
+            has_previous_analysis = any(indicator in previous_lower for indicator in _RETRY_ANALYSIS_MARKERS)
             
             if is_retry and has_previous_analysis:
-                context += "SKIP ANALYSIS - GO DIRECTLY TO IMPLEMENTATION:\n"
-                context += "```python\n"
-                context += "# Analysis already done. CREATE FILES NOW!\n"
-                context += "# Use write_file() for new files\n"
-                context += "# Use edit_file() for small changes to existing files\n"
-                context += "```\n\n"
+                parts.append(_SKIP_ANALYSIS_BLOCK)
             else:
-                context += "EXECUTE THIS PATTERN:\n"
-                context += "```python\n"
-                context += "# 1. Check what exists\n"
-                context += "files = list_files()\n"
-                context += "print(files)\n"
-                context += "```\n\n"
-                context += "```python\n"
-                context += "# 2. Create/modify files based on the task\n"
-                context += "# Use write_file() for new files\n"
-                context += "# Use edit_file() for small changes to existing files\n"
-                context += "# Use read_file() + write_file() for major changes\n"
-                context += "```\n\n"
+                parts.append(_EXECUTE_PATTERN_BLOCK)
             
             # Add specific guidance for project creation tasks
-            if "create" in next_todo.content.lower() and "project" in next_todo.content.lower():
-                context += "🚨 PROJECT CREATION TASK - YOU MUST CREATE FILES:\n"
-                context += "When creating a project directory, you MUST also create initial files:\n"
-                context += "- Create the project directory structure\n"
-                context += "- Initialize the project with appropriate config files\n"
-                context += "- Create initial source files\n"
-                context += "- Add a README.md file\n\n"
-                context += "IMPORTANT: Creating just the directory is NOT enough. You MUST create files!\n\n"
+            if "create" in content_lower and "project" in content_lower:
+                parts.append(_PROJECT_CREATION_BLOCK)
             
             # Legacy: Check if we have sub-tasks to execute
-            if hasattr(self, 'current_subtask_manager') and self.current_subtask_manager:
+            if self.current_subtask_manager is not None:
                 next_subtask = self.current_subtask_manager.get_next_subtask()
                 if next_subtask:
-                    context += "\n[EXECUTING SUB-TASK]\n"
-                    context += f"Type: {next_subtask.type.value}\n"
-                    context += f"Description: {next_subtask.description}\n\n"
-                    context += "Execute ONLY this code:\n"
-                    context += "```python\n"
-                    context += next_subtask.code
-                    context += "\n```\n\n"
-                    context += "IMPORTANT: Execute ONLY the code above. Do not add explanations.\n"
-                    return context
+                    parts.extend([
+                        "\n[EXECUTING SUB-TASK]\n",
+                        f"Type: {next_subtask.type.value}\n",
+                        f"Description: {next_subtask.description}\n\n",
+                        "Execute ONLY this code:\n```python\n",
+                        next_subtask.code,
+                        "\n```\n\n"
+                        "IMPORTANT: Execute ONLY the code above. Do not add explanations.\n"
+                    ])
+                    return "".join(parts)
             
             # Add specific guidance for information gathering tasks
-            if "gather" in next_todo.content.lower() or "analyze" in next_todo.content.lower() or "document" in next_todo.content.lower():
+            if "gather" in content_lower or "analyze" in content_lower or "document" in content_lower:
                 # Check if analysis was already done in previous results
-                if previous_results and any(indicator in previous_results.lower() for indicator in 
-                    ['files:', 'found:', 'current files:', 'project structure:', 'analysis complete']):
-                    context += "\n[ANALYSIS ALREADY COMPLETE - SKIP TO IMPLEMENTATION]\n\n"
-                    context += "Previous analysis found the necessary information.\n"
-                    context += "Now IMPLEMENT based on what was discovered.\n\n"
+                if any(indicator in previous_lower for indicator in _ANALYSIS_DONE_MARKERS):
+                    parts.append(_ANALYSIS_COMPLETE_BLOCK)
                 else:
-                    context += "\n[ANALYSIS TASK - EXECUTE THESE COMMANDS]\n\n"
-                    context += "Execute each code block below one at a time:\n\n"
-                    context += "```python\n"
-                    context += "# Read project context\n"
-                    context += "content = read_file('OLLAMA.md')\n"
-                    context += "print(content[:1000])\n"
-                    context += "```\n\n"
-                    context += "```python\n"
-                    context += "# List project files\n"
-                    context += "files = list_files()\n"
-                    context += "print(files)\n"
-                    context += "```\n\n"
-                    context += "```python\n"
-                    context += "# Find Python files\n"
-                    context += "result = bash('find . -name \\\"*.py\\\" | head -20')\n"
-                    context += "print(result)\n"
-                    context += "```\n\n"
-                    context += "After executing, summarize what you found.\n"
+                    parts.append(_ANALYSIS_TASK_TEMPLATE)
             
             # Add specific guidance for file creation tasks
-            elif any(word in next_todo.content.lower() for word in ['create', 'write', 'develop', 'implement', 'script', 'test', 'endpoint', 'backend', 'service', 'websocket', 'socket']):
-                context += "\n[FILE CREATION/MODIFICATION TASK - EXECUTE NOW]\n\n"
-                context += "🚨 YOU MUST EXECUTE CODE TO CREATE/MODIFY FILES!\n\n"
-                context += "Step 1: Check what files exist:\n"
-                context += "```python\n"
-                context += "import os\n"
-                context += "files = list_files()\n"
-                context += "print(\"Current files:\", files)\n"
-                context += "```\n\n"
-                context += "Step 2: Read existing files if modifying:\n"
-                context += "```python\n"
-                context += "# Read any files you need to modify\n"
-                context += "# based on what you found in step 1\n"
-                context += "```\n\n"
-                context += "Step 3: CREATE THE FILES NOW:\n"
-                context += "```python\n"
-                context += "# STOP! DO NOT SKIP THIS STEP!\n"
-                context += "# You MUST execute write_file() commands here!\n"
-                context += "\n"
-                context += "# Example (replace with actual implementation):\n"
-                context += "write_file(\"server.js\", \"\"\"// Your server code here\"\"\")\n"
-                context += "write_file(\"index.html\", \"\"\"<!-- Your HTML here -->\"\"\")\n"
-                context += "\n"
-                context += "# THE TASK WILL FAIL IF YOU DON'T CREATE FILES!\n"
-                context += "```\n\n"
-                context += "🚨 CRITICAL: EXECUTE write_file() COMMANDS NOW!\n\n"
-                
-                # Add bash command guidance
-                context += "BASH COMMAND GUIDELINES:\n"
-                context += "- Always use proper directory navigation: bash('cd project && command')\n"
-                context += "- Check if directories exist before navigating: bash('ls')\n"
-                context += "- Use && to chain commands that depend on each other\n"
-                context += "- Use ; to run independent commands\n"
-                context += "- Always quote paths with spaces\n\n"
+            elif any(word in content_lower for word in _FILE_CREATION_KEYWORDS):
+                parts.append(_FILE_CREATION_EXAMPLES)
                 
                 # Add directory creation guidance for GUI tasks
-                if "gui" in next_todo.content.lower() or "html" in next_todo.content.lower():
-                    context += "📁 FOR GUI FILES - CREATE DIRECTORIES FIRST:\n"
-                    context += "- Create appropriate directory structure (e.g., public/, src/, assets/)\n"
-                    context += "- Place HTML/CSS/JS files in the correct directories\n\n"
+                if "gui" in content_lower or "html" in content_lower:
+                    parts.append(_GUI_DIRECTORIES_BLOCK)
                 
                 # Add working directory context
-                context += f"CURRENT WORKING DIRECTORY: {os.getcwd()}\n\n"
+                parts.append(f"CURRENT WORKING DIRECTORY: {self._cwd}\n\n")
                 
                 # Add Ollama-specific context if relevant
-                if "ollama" in next_todo.content.lower():
-                    context += "OLLAMA API REFERENCE:\n"
-                    context += "- Base URL: http://localhost:11434\n"
-                    context += "- Chat endpoint: POST /api/chat with {model, messages, stream}\n"
-                    context += "- Generate endpoint: POST /api/generate with {model, prompt, stream}\n"
-                    context += "- Models endpoint: GET /api/tags\n"
-                    context += "- Use 'llama2' as default model name\n\n"
+                if "ollama" in content_lower:
+                    parts.append(_OLLAMA_API_REFERENCE)
                 
                 # Provide general file creation guidance
-                context += "IMPORTANT: Always use Python code blocks with write_file() - NEVER use other language code blocks!\n"
+                parts.append("IMPORTANT: Always use Python code blocks with write_file() - NEVER use other language code blocks!\n")
             
             # Add specific guidance for OLLAMA.md update tasks
-            elif "ollama.md" in next_todo.content.lower() and ("update" in next_todo.content.lower() or "document" in next_todo.content.lower()):
-                context += "\n[Guidance for updating OLLAMA.md:]"
-                context += "\n- Use read_file('OLLAMA.md') to check current content"
-                context += "\n- If it doesn't exist, create it with write_file()"
-                context += "\n- Add or update sections based on work completed:"
-                context += "\n  - New features implemented"
-                context += "\n  - API endpoints created"
-                context += "\n  - Configuration changes"
-                context += "\n  - Usage instructions"
-                context += "\n- Keep the documentation concise and helpful\n"
+            elif "ollama.md" in content_lower and ("update" in content_lower or "document" in content_lower):
+                parts.append(_OLLAMA_MD_GUIDANCE)
             
             # Don't include information about other tasks to maintain focus
             # The AI should only know about the current task
             
-            return context
+            return "".join(parts)
         return None
     
     def mark_current_task_complete(self, result: str = None):
@@ -466,16 +603,11 @@ class ThoughtLoop:
     
     def should_continue_tasks(self) -> bool:
         """Check if there are more tasks to complete"""
-        pending = self.todo_manager.get_todos_by_status(TodoStatus.PENDING)
-        in_progress = self.todo_manager.get_todos_by_status(TodoStatus.IN_PROGRESS)
-        return len(pending) > 0 or len(in_progress) > 0
+        return self.todo_manager.has_active()
     
     def get_progress_summary(self) -> str:
         """Get a summary of task progress"""
-        total = len(self.todo_manager.todos)
-        completed = len(self.todo_manager.get_todos_by_status(TodoStatus.COMPLETED))
-        in_progress = len(self.todo_manager.get_todos_by_status(TodoStatus.IN_PROGRESS))
-        pending = len(self.todo_manager.get_todos_by_status(TodoStatus.PENDING))
+        _, in_progress, completed, total = self.todo_manager.get_status_counts()
         
         if total == 0:
             return ""
@@ -4,7 +4,7 @@ import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from rich.console import Console
 from rich.table import Table
@@ -26,6 +26,28 @@ class TodoPriority(Enum):
     LOW = "low"
 
 
+# Status emojis and colors for the todo table
+_STATUS_DISPLAY = {
+    TodoStatus.PENDING: ("⏳", "yellow"),
+    TodoStatus.IN_PROGRESS: ("🔄", "blue"),
+    TodoStatus.COMPLETED: ("✅", "green"),
+    TodoStatus.CANCELLED: ("❌", "red")
+}
+
+# Priority label and sort rank for the todo table
+_PRIORITY_DISPLAY = {
+    TodoPriority.HIGH: ("[red]HIGH[/red]", 1),
+    TodoPriority.MEDIUM: ("[yellow]MEDIUM[/yellow]", 2),
+    TodoPriority.LOW: ("[dim]LOW[/dim]", 3)
+}
+
+_PRIORITY_COLORS = {
+    TodoPriority.HIGH: "red",
+    TodoPriority.MEDIUM: "yellow",
+    TodoPriority.LOW: "dim"
+}
+
+
 class TodoItem:
     def __init__(self, content: str, priority: TodoPriority = TodoPriority.MEDIUM, 
                  status: TodoStatus = TodoStatus.PENDING, id: str = None,
@@ -68,8 +90,16 @@ class TodoManager:
         # Use .ollama-code directory for todos file
         self.todos_file = todos_file or ollama_code_dir / "todos.json"
         self.todos: List[TodoItem] = []
+        # Todos grouped by status, in list order; kept in sync by the mutating methods
+        self._by_status: Dict[TodoStatus, List[TodoItem]] = {}
         self.load_todos()
     
+    def _reindex(self):
+        """Rebuild the status index from the todo list"""
+        self._by_status = {status: [] for status in TodoStatus}
+        for todo in self.todos:
+            self._by_status[todo.status].append(todo)
+    
     def load_todos(self):
         """Load todos from file"""
         if self.todos_file.exists():
@@ -82,6 +112,7 @@ class TodoManager:
                 self.todos = []
         else:
             self.todos = []
+        self._reindex()
     
     def save_todos(self):
         """Save todos to file"""
@@ -99,9 +130,19 @@ class TodoManager:
         """Add a new todo"""
         todo = TodoItem(content, priority)
         self.todos.append(todo)
+        self._by_status[todo.status].append(todo)
         self.save_todos()
         return todo
     
+    def add_todos_bulk(self, items: List[Tuple[str, TodoPriority]]) -> List[TodoItem]:
+        """Add several (content, priority) todos, saving once"""
+        todos = [TodoItem(content, priority) for content, priority in items]
+        self.todos.extend(todos)
+        self._by_status[TodoStatus.PENDING].extend(todos)
+        if todos:
+            self.save_todos()
+        return todos
+    
     def update_todo(self, todo_id: str, **kwargs) -> Optional[TodoItem]:
         """Update a todo by ID"""
         for todo in self.todos:
@@ -111,7 +152,11 @@ class TodoManager:
                 if "priority" in kwargs:
                     todo.priority = TodoPriority(kwargs["priority"])
                 if "status" in kwargs:
-                    todo.status = TodoStatus(kwargs["status"])
+                    status = TodoStatus(kwargs["status"])
+                    if status != todo.status:
+                        todo.status = status
+                        # Rebuild so each status list keeps the todo list order
+                        self._reindex()
                 todo.updated_at = datetime.now().isoformat()
                 self.save_todos()
                 return todo
@@ -122,6 +167,7 @@ class TodoManager:
         for i, todo in enumerate(self.todos):
             if todo.id == todo_id:
                 del self.todos[i]
+                self._by_status[todo.status].remove(todo)
                 self.save_todos()
                 return True
         return False
@@ -135,7 +181,18 @@ class TodoManager:
     
     def get_todos_by_status(self, status: TodoStatus) -> List[TodoItem]:
         """Get all todos with a specific status"""
-        return [todo for todo in self.todos if todo.status == status]
+        return list(self._by_status[status])
+    
+    def has_active(self) -> bool:
+        """Check if any todo is pending or in progress"""
+        return bool(self._by_status[TodoStatus.PENDING] or self._by_status[TodoStatus.IN_PROGRESS])
+    
+    def get_status_counts(self) -> Tuple[int, int, int, int]:
+        """Get (pending, in_progress, completed, total) todo counts"""
+        return (len(self._by_status[TodoStatus.PENDING]),
+                len(self._by_status[TodoStatus.IN_PROGRESS]),
+                len(self._by_status[TodoStatus.COMPLETED]),
+                len(self.todos))
     
     def get_next_todo(self) -> Optional[TodoItem]:
         """Get the next pending or in-progress todo (prioritized by high > medium > low)"""
@@ -170,31 +227,17 @@ class TodoManager:
         table.add_column("Task", style="white")
         table.add_column("ID", style="dim", width=8)
         
-        # Define status emojis and colors
-        status_display = {
-            TodoStatus.PENDING: ("⏳", "yellow"),
-            TodoStatus.IN_PROGRESS: ("🔄", "blue"),
-            TodoStatus.COMPLETED: ("✅", "green"),
-            TodoStatus.CANCELLED: ("❌", "red")
-        }
-        
-        priority_display = {
-            TodoPriority.HIGH: ("[red]HIGH[/red]", 1),
-            TodoPriority.MEDIUM: ("[yellow]MEDIUM[/yellow]", 2),
-            TodoPriority.LOW: ("[dim]LOW[/dim]", 3)
-        }
-        
         # Sort by status (in-progress first), then priority
         sorted_todos = sorted(todos_to_show, 
                             key=lambda t: (
                                 0 if t.status == TodoStatus.IN_PROGRESS else 1,
-                                priority_display[t.priority][1],
+                                _PRIORITY_DISPLAY[t.priority][1],
                                 t.created_at
                             ))
         
         for i, todo in enumerate(sorted_todos, 1):
-            emoji, color = status_display[todo.status]
-            priority_text, _ = priority_display[todo.priority]
+            emoji, color = _STATUS_DISPLAY[todo.status]
+            priority_text, _ = _PRIORITY_DISPLAY[todo.priority]
             
             table.add_row(
                 str(i),
@@ -207,9 +250,7 @@ class TodoManager:
         console.print(table)
         
         # Show summary
-        pending_count = len(self.get_todos_by_status(TodoStatus.PENDING))
-        in_progress_count = len(self.get_todos_by_status(TodoStatus.IN_PROGRESS))
-        completed_count = len(self.get_todos_by_status(TodoStatus.COMPLETED))
+        pending_count, in_progress_count, completed_count, _ = self.get_status_counts()
         
         console.print(f"\n📊 Summary: {pending_count} pending, {in_progress_count} in progress, {completed_count} completed")
     
@@ -217,13 +258,7 @@ class TodoManager:
         """Display the next todo to work on"""
         next_todo = self.get_next_todo()
         if next_todo:
-            priority_colors = {
-                TodoPriority.HIGH: "red",
-                TodoPriority.MEDIUM: "yellow",
-                TodoPriority.LOW: "dim"
-            }
-            
-            color = priority_colors[next_todo.priority]
+            color = _PRIORITY_COLORS[next_todo.priority]
             status_text = "🔄 In Progress" if next_todo.status == TodoStatus.IN_PROGRESS else "⏳ Next Up"
             
             console.print(Panel(
@@ -239,6 +274,7 @@ class TodoManager:
     def clear(self):
         """Clear all todos"""
         self.todos = []
+        self._reindex()
         self.save_todos()
     
     def parse_todo_command(self, command: str) -> Dict: